@@ -12,6 +12,14 @@ if "--with-audio" in sys.argv:
     install_requires.extend(['pyaudio'])
     sys.argv.remove("--with-audio")
 
+if "--with-jit" in sys.argv:
+    install_requires.extend(['numba'])
+    sys.argv.remove("--with-jit")
+
+if "--with-gpu" in sys.argv:
+    install_requires.extend(['ffmpegcv'])
+    sys.argv.remove("--with-gpu")
+
 if "--with-server" in sys.argv:
     install_requires.extend(['paramiko'])
     sys.argv.remove("--with-server")
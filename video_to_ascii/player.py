@@ -7,7 +7,7 @@ def play(filename, strategy=None, output=None, output_format=None, play_audio=Fa
     """
     Play or export a video from a file by default using ascii chars in terminal
     """
-    engine = ve.VideoEngine()
+    engine = ve.VideoEngine(strategy or "default")
     engine.load_video_from_file(filename)
     if  play_audio:
         import ffmpeg
@@ -18,6 +18,4 @@ def play(filename, strategy=None, output=None, output_format=None, play_audio=Fa
         stream = ffmpeg.overwrite_output(stream)
         ffmpeg.run(stream)
         engine.with_audio = True
-    if strategy is not None:
-        engine.set_strategy(strategy)
     engine.play(output, output_format)
@@ -1,14 +1,23 @@
+import os
+import cv2
+
+# Let OpenCV use its optimized code paths and spread filters over the cores,
+# leaving one free for decoding and writing to the terminal
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
+
 from . import ascii_bw_strategy as bw
 from . import ascii_color_strategy as color
 from . import ascii_color_filled_strategy as filled
 from . import adaptive_ascii_strategy as adaptive
 from . import cinematic_ascii_strategy as cinematic
 
+# Strategy classes are instantiated on demand by the video engine
 STRATEGIES = {
-    "default": color.AsciiColorStrategy(),
-    "ascii-color": color.AsciiColorStrategy(),
-    "just-ascii": bw.AsciiBWStrategy(),
-    "filled-ascii": filled.AsciiColorFilledStrategy(),
-    "adaptive": adaptive.AdaptiveAsciiStrategy(),
-    "cinematic": cinematic.CinematicAsciiStrategy()
+    "default": color.AsciiColorStrategy,
+    "ascii-color": color.AsciiColorStrategy,
+    "just-ascii": bw.AsciiBWStrategy,
+    "filled-ascii": filled.AsciiColorFilledStrategy,
+    "adaptive": adaptive.AdaptiveAsciiStrategy,
+    "cinematic": cinematic.CinematicAsciiStrategy
 }
\ No newline at end of file
@@ -16,59 +16,54 @@ else:
 class AdaptiveAsciiStrategy(strategy.AsciiStrategy):
     """Render video with enhanced edge detection and adaptive contrast"""
 
+    def __init__(self):
+        """Initialize the filters reused across frames"""
+        self._clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
+        self._kernel = np.ones((2, 2), np.uint8)
+        super().__init__()
+
     def resize_frame(self, frame, dimensions=strategy.DEFAULT_TERMINAL_SIZE):
         """
         Resize frame with adaptive contrast enhancement and edge detection
         """
-        # First resize the frame using the parent method
-        resized = super().resize_frame(frame, dimensions)
+        # First resize the frame using the parent method, without cropping
+        # it since the CLAHE tiles are laid over the whole frame
+        resized = super().resize_frame(frame, dimensions, crop=False)
         
         # Convert to LAB color space for better color processing
-        lab = cv2.cvtColor(resized, cv2.COLOR_BGR2LAB)
-        l, a, b = cv2.split(lab)
+        lab = cv2.cvtColor(resized, cv2.COLOR_BGR2LAB, dst=self.frame_buffer('lab', resized.shape))
         
         # Apply CLAHE (Contrast Limited Adaptive Histogram Equalization)
-        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-        cl = clahe.apply(l)
-        
-        # Merge the CLAHE enhanced L-channel back with A and B channels
-        limg = cv2.merge((cl, a, b))
-        enhanced = cv2.cvtColor(limg, cv2.COLOR_LAB2BGR)
+        # to the L-channel in place, keeping the A and B channels
+        lab[..., 0] = self._clahe.apply(lab[..., 0])
+        enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=self.frame_buffer('enhanced', resized.shape))
         
         # Apply bilateral filter to reduce noise while preserving edges
-        smoothed = cv2.bilateralFilter(enhanced, 9, 75, 75)
+        smoothed = cv2.bilateralFilter(enhanced, 9, 75, 75, dst=self.frame_buffer('smoothed', resized.shape))
         
-        # Detect edges using Canny
-        gray = cv2.cvtColor(smoothed, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
+        # Detect edges using Canny on the CLAHE enhanced L-channel,
+        # which already is the luminance of the frame
+        edges = cv2.Canny(lab[..., 0], 50, 150, edges=self.frame_buffer('edges', resized.shape[:2]))
         
         # Dilate the edges to make them more visible
-        kernel = np.ones((2, 2), np.uint8)
-        edges = cv2.dilate(edges, kernel, iterations=1)
+        edges = cv2.dilate(edges, self._kernel, dst=self.frame_buffer('dilated', resized.shape[:2]), iterations=1)
         
         # Create final enhanced image by combining the smoothed image with edges
-        result = smoothed.copy()
-        for i in range(3):
-            result[:,:,i] = cv2.addWeighted(smoothed[:,:,i], 0.7, edges, 0.3, 0)
+        edges_bgr = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR, dst=self.frame_buffer('edges_bgr', resized.shape))
+        result = cv2.addWeighted(smoothed, 0.7, edges_bgr, 0.3, 0, dst=self.frame_buffer('result', resized.shape))
         
-        return result
+        return self.crop_frame(result, dimensions)
+
+    def convert_pixels_to_ascii_rows(self, frame):
+        """
+        Convert the whole frame at once with the detailed character set
+        """
+        return ipe.frame_to_ascii(frame, density=3)
 
     def apply_pixel_to_ascii_strategy(self, pixel):
         """
         Apply enhanced pixel to ASCII conversion for better visibility
         """
-        # Increase saturation for more vibrant colors
-        bgr = tuple(float(x) for x in pixel[:3])
-        rgb = tuple(reversed(bgr))
-        
-        # Increase color saturation for better visibility
-        h, s, v = ipe.colorsys.rgb_to_hsv(*rgb)
-        s = min(s * 1.4, 1.0)  # Increase saturation by 40%
-        v = min(v * 1.1, 1.0)  # Slight boost to value/brightness
-        rgb_enhanced = ipe.colorsys.hsv_to_rgb(h, s, v)
-        
-        # Use detailed character set (CHARS_DETAILED) for better differentiation
-        bright = ipe.rgb_to_brightness(*rgb_enhanced)
-        
-        # We want to use the detailed character set (density=3)
+        # Use detailed character set (CHARS_DETAILED) for better differentiation,
+        # pixel_to_ascii already increases the saturation of the pixel color
         return ipe.pixel_to_ascii(pixel, density=3) 
\ No newline at end of file
@@ -12,6 +12,12 @@ else:
 class AsciiBWStrategy(strategy.AsciiStrategy):
     """Print each frame in the terminal using one color ascii characters"""
 
+    def convert_pixels_to_ascii_rows(self, frame):
+        """
+        Convert the whole frame at once to chars
+        """
+        return ipe.frame_to_ascii(frame, colored=False)
+
     def apply_pixel_to_ascii_strategy(self, pixel):
         """
         Define a pixel parsing strategy to use colored chars
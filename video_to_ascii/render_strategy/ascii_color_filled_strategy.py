@@ -13,6 +13,12 @@ else:
 class AsciiColorFilledStrategy(strategy.AsciiStrategy):
     """Print each frame in the terminal using ascii characters"""
 
+    def convert_pixels_to_ascii_rows(self, frame):
+        """
+        Convert the whole frame at once to colored chars
+        """
+        return ipe.frame_to_ascii(frame, density=2)
+
     def apply_pixel_to_ascii_strategy(self, pixel):
         """
         Define a pixel parsing strategy to use high density colored chars
@@ -12,6 +12,12 @@ else:
 class AsciiColorStrategy(strategy.AsciiStrategy):
     """Print each frame in the terminal using ascii characters"""
 
+    def convert_pixels_to_ascii_rows(self, frame):
+        """
+        Convert the whole frame at once to colored chars
+        """
+        return ipe.frame_to_ascii(frame, density=1)
+
     def apply_pixel_to_ascii_strategy(self, pixel):
         """
         Define a pixel parsing strategy to use colored chars
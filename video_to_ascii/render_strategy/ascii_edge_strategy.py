@@ -15,29 +15,39 @@ else:
 class AsciiEdgeStrategy(strategy.AsciiStrategy):
     """Print each frame in the terminal using edge-enhanced ascii characters"""
 
+    def __init__(self):
+        """Initialize the dilation kernel reused across frames"""
+        self._kernel = np.ones((2, 2), np.uint8)
+        super().__init__()
+
     def resize_frame(self, frame, dimensions=strategy.DEFAULT_TERMINAL_SIZE):
         """
         Resize a frame and enhance edges for better visibility
         """
-        # First resize the frame using the parent method
-        resized = super().resize_frame(frame, dimensions)
+        # First resize the frame using the parent method, without cropping
+        # it so the crop line isn't detected as an image border
+        resized = super().resize_frame(frame, dimensions, crop=False)
         
         # Convert to grayscale for edge detection
-        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY, dst=self.frame_buffer('gray', resized.shape[:2]))
         
         # Apply edge detection
-        edges = cv2.Canny(gray, 50, 150)
+        edges = cv2.Canny(gray, 50, 150, edges=self.frame_buffer('edges', resized.shape[:2]))
         
         # Dilate the edges to make them more visible
-        kernel = np.ones((2, 2), np.uint8)
-        edges = cv2.dilate(edges, kernel, iterations=1)
+        edges = cv2.dilate(edges, self._kernel, dst=self.frame_buffer('dilated', resized.shape[:2]), iterations=1)
         
-        # Enhance the original image by emphasizing edges
-        enhanced = resized.copy()
-        for i in range(3):  # For each color channel
-            enhanced[:,:,i] = cv2.addWeighted(resized[:,:,i], 0.8, edges, 0.2, 0)
+        # Enhance the original image by emphasizing edges on every color channel
+        edges_bgr = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR, dst=self.frame_buffer('edges_bgr', resized.shape))
+        enhanced = cv2.addWeighted(resized, 0.8, edges_bgr, 0.2, 0, dst=self.frame_buffer('enhanced', resized.shape))
             
-        return enhanced
+        return self.crop_frame(enhanced, dimensions)
+
+    def convert_pixels_to_ascii_rows(self, frame):
+        """
+        Convert the whole frame at once with a wider range of characters
+        """
+        return ipe.frame_to_ascii(frame, colored=True, density=1)
 
     def apply_pixel_to_ascii_strategy(self, pixel):
         """
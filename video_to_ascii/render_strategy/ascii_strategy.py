@@ -6,6 +6,7 @@ import time
 import sys
 import os
 import cv2
+import numpy as np
 import tempfile 
 
 PLATFORM = 0
@@ -23,16 +24,30 @@ DEFAULT_TERMINAL_SIZE = _term_size().columns, _term_size().lines
 class AsciiStrategy(re.RenderStrategy):
     """Print each frame in the terminal using ascii characters"""
 
+    def __init__(self):
+        """Initialize the buffers reused across frames"""
+        self._buffers = {}
+
+    def frame_buffer(self, name, shape, dtype=np.uint8):
+        """
+        Get a buffer reused across frames to write the result of an
+        image operation, it is reallocated if the frame size changes
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype)
+            self._buffers[name] = buffer
+        return buffer
+
     def convert_frame_pixels_to_ascii(self, frame, dimensions=DEFAULT_TERMINAL_SIZE, new_line_chars=False):
         """
         Replace all pixels with colored chars and return the resulting string
 
-        This method iterates each pixel of one video frame
-        respecting the dimensions of the printing area
-        to truncate the width if necessary
-        and use the pixel_to_ascii method to convert one pixel
-        into a character with the appropriate color.
-        Finally joins the set of chars in a string ready to print.
+        This method crops one video frame to the dimensions
+        of the printing area to truncate the width if necessary
+        and use the convert_pixels_to_ascii_rows method to convert
+        its pixels into characters with the appropriate color.
+        Finally joins the set of rows in a string ready to print.
 
         Args:
             frame: a single video frame
@@ -50,19 +65,24 @@ class AsciiStrategy(re.RenderStrategy):
 
         printing_width = int(min(int(cols), (w*2))/2)
         pad = max(int(cols) - printing_width*2, 0) 
-         
-        
-        msg = ''
-        for j in range(h-1):
-            for i in range(printing_width):
-                pixel = frame[j][i]
-                msg += self.apply_pixel_to_ascii_strategy(pixel)
-            if new_line_chars:
-                msg += "\n"
-            else:
-                msg += " " * (pad)
-        msg += "\r\n"
-        return msg
+
+        rows = self.convert_pixels_to_ascii_rows(frame[:h-1, :printing_width])
+        end_line = "\n" if new_line_chars else " " * (pad)
+        return "".join([row + end_line for row in rows]) + "\r\n"
+
+    def convert_pixels_to_ascii_rows(self, frame):
+        """
+        Convert each pixel of the printing area with the
+        apply_pixel_to_ascii_strategy method, strategies able to
+        convert the whole area at once can override it
+
+        Args:
+            frame: the video frame cropped to the printing area
+
+        Returns:
+            list: A string of colored chars for each row
+        """
+        return ["".join([self.apply_pixel_to_ascii_strategy(pixel) for pixel in row]) for row in frame]
 
     def apply_pixel_to_ascii_strategy(self, pixel):
         return ipe.pixel_to_ascii(pixel)
@@ -80,7 +100,8 @@ class AsciiStrategy(re.RenderStrategy):
         convert_frame_pixels_to_ascii.
         Finally each final string is printed correctly, if the process
         was done too fast will sleep the necessary time to comply
-        with the fps expected (30 fps by default).
+        with the fps expected (30 fps by default), if it was too slow
+        the frames left behind are grabbed without retrieving them.
 
         Args:
             cap: An OpenCV video capture
@@ -122,20 +143,32 @@ class AsciiStrategy(re.RenderStrategy):
 
         time_delta = 1./fps
         counter=0
+        # frame n of the video is due at start_time + n * time_delta
+        start_time = None
+        index = -1
+        skip = 0
         if PLATFORM:
             sys.stdout.write("echo -en '\033[2J' \n")
         else:
             sys.stdout.write('\033[2J')
         # read each frame
         while cap.isOpened():
-            t0 = time.process_time()
             if PLATFORM:
                 rows, cols = os.popen('stty size', 'r').read().split()
             else:
                 cols, rows = os.get_terminal_size()
+            # grab the frames that won't be rendered without retrieving them
+            for _ in range(skip):
+                if not cap.grab():
+                    break
+                index += 1
+                if with_audio:
+                    data = wave_file.readframes(chunk)
+                    stream.write(data)
             _ret, frame = cap.read()
             if frame is None:
                 break
+            index += 1
             if with_audio:
                 data = wave_file.readframes(chunk)
                 stream.write(data)
@@ -149,11 +182,13 @@ class AsciiStrategy(re.RenderStrategy):
                 resized_frame = self.resize_frame(frame, (cols, rows))
                 # convert frame pixels to colored string
                 msg = self.convert_frame_pixels_to_ascii(resized_frame, (cols, rows)) 
-                t1 = time.process_time()
-                delta = time_delta - (t1 - t0)
-                if delta > 0:
-                    time.sleep(delta)
+                # maintain framerate against a fixed schedule so the delays don't accumulate
+                if start_time is None:
+                    start_time = time.monotonic()
+                time.sleep(max(0, start_time + index * time_delta - time.monotonic()))
                 sys.stdout.write(msg) # Print the final string
+                # grab the frames that are already due without retrieving them
+                skip = max(int((time.monotonic() - start_time) / time_delta) - index, 0)
             else:
                 print(self.build_progress(counter, length))
                 if PLATFORM:
@@ -201,18 +236,22 @@ class AsciiStrategy(re.RenderStrategy):
         progress_bar = ('█' * adjusted_size_percent) + ('░' * (20-adjusted_size_percent))
         return  "  " +  "|" +  progress_bar + "| " + str(progress_percent) + "%"
 
-    def resize_frame(self, frame, dimensions=DEFAULT_TERMINAL_SIZE):
+    def resize_frame(self, frame, dimensions=DEFAULT_TERMINAL_SIZE, crop=True):
         """
         Resize a frame to meet the terminal dimensions
 
         Calculating the output terminal dimensions (cols, rows),
         we can get a reduction factor to resize the frame
         according to the height of the terminal mainly
-        to print each frame at a time, using all the available rows
+        to print each frame at a time, using all the available rows.
+        The columns that don't fit the terminal width are cropped
+        so the strategies don't process pixels that won't be printed
 
         Args:
             frame: Frame to resize
             dimensions: If you want to set a printer area size (cols, rows)
+            crop: If the frame should be cropped to the terminal width,
+                strategies using the whole frame crop it with crop_frame
         Returns:
             A resized frame
         """
@@ -222,6 +261,17 @@ class AsciiStrategy(re.RenderStrategy):
         reduced_width = int(width * reduction_factor / 100)
         reduced_height = int(height * reduction_factor / 100)
         dimension = (reduced_width, reduced_height)
-        resized_frame = cv2.resize(frame, dimension, interpolation=cv2.INTER_LINEAR)
-        return resized_frame
+        resized_frame = self.frame_buffer('resized', (reduced_height, reduced_width, 3))
+        cv2.resize(frame, dimension, dst=resized_frame, interpolation=cv2.INTER_LINEAR)
+        if not crop:
+            return resized_frame
+        return self.crop_frame(resized_frame, dimensions)
+
+    def crop_frame(self, frame, dimensions=DEFAULT_TERMINAL_SIZE):
+        """
+        Crop a resized frame to the columns that fit the terminal width
+        """
+        cols, _ = dimensions
+        # each pixel is printed as two chars
+        return frame[:, :int(cols)//2]
         
@@ -17,17 +17,22 @@ else:
 # Characters specifically for human figures
 HUMAN_CHARS = '@#$%&'  # Bold, distinct characters for human figures
 
+# Characters for strong edges, indexed by the values of edge_char_mask
+EDGE_CHARS = ['', '-', '|']
+
 class CinematicAsciiStrategy(strategy.AsciiStrategy):
     """Render video with cinematographer-level quality ASCII conversion"""
     
     def __init__(self):
-        """Initialize with frame history for temporal processing"""
-        self.prev_frames = []
+        """Initialize with the previous frame state for temporal processing"""
         self.prev_gray = None
         self.prev_motion = None
-        self.max_frames = 3  # Reduced frame history for better performance
         self.frame_count = 0
         self.human_mask = None
+        self.gradient_magnitude = None
+        self.gradient_direction = None
+        self.edge_char_mask = None
+        self._dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_ULTRAFAST)
         super().__init__()
     
     def resize_frame(self, frame, dimensions=strategy.DEFAULT_TERMINAL_SIZE):
@@ -39,21 +44,17 @@ class CinematicAsciiStrategy(strategy.AsciiStrategy):
         # First resize the frame using the parent method
         resized = super().resize_frame(frame, dimensions)
         
-        # Convert to grayscale for processing - do this once and reuse
-        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
-        
-        # Store for temporal processing - only keep a few frames
-        self.prev_frames.append(resized.copy())
-        if len(self.prev_frames) > self.max_frames:
-            self.prev_frames.pop(0)
+        # Convert to grayscale for processing - do this once and reuse,
+        # alternating two buffers since the previous gray frame is kept
+        shape = resized.shape[:2]
+        gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY,
+                            dst=self.frame_buffer('gray%d' % (self.frame_count % 2), shape))
         
         # Motion detection - only do this every other frame to improve performance
         if self.frame_count % 2 == 0 and self.prev_gray is not None:
             try:
-                # Simplified optical flow with optimized parameters
-                flow = cv2.calcOpticalFlowFarneback(
-                    self.prev_gray, gray, None, 0.5, 3, 15, 3, 5, 1.1, 0
-                )
+                # DIS optical flow is much cheaper than Farneback and good enough for a motion mask
+                flow = self._dis.calc(self.prev_gray, gray, None)
                 
                 # Calculate motion magnitude
                 mag, _ = cv2.cartToPolar(flow[..., 0], flow[..., 1])
@@ -76,82 +77,60 @@ class CinematicAsciiStrategy(strategy.AsciiStrategy):
         self.prev_gray = gray
         
         # Calculate edges for character selection - simplified approach
-        sobel_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobel_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+        sobel_x = cv2.Sobel(gray, cv2.CV_32F, 1, 0, dst=self.frame_buffer('sobel_x', shape, np.float32), ksize=3)
+        sobel_y = cv2.Sobel(gray, cv2.CV_32F, 0, 1, dst=self.frame_buffer('sobel_y', shape, np.float32), ksize=3)
+        
+        # Store gradient direction (0-360 degrees) and magnitude for character selection
+        self.gradient_direction = cv2.phase(sobel_x, sobel_y, self.frame_buffer('direction', shape, np.float32),
+                                            angleInDegrees=True)
+        self.gradient_magnitude = cv2.magnitude(sobel_x, sobel_y, self.frame_buffer('magnitude', shape, np.float32))
+        self.gradient_magnitude *= 1.0 / 255.0  # Normalize to 0-1
         
-        # Store gradient direction and magnitude for character selection
-        self.gradient_direction = np.arctan2(sobel_y, sobel_x) * 180 / np.pi
-        self.gradient_magnitude = cv2.magnitude(sobel_x, sobel_y) / 255.0  # Normalize to 0-1
+        # Select the directional character of strong edges: 0 none, 1 '-', 2 '|'
+        # Opposite directions use the same character
+        angle = self.gradient_direction % 180
+        strong = self.gradient_magnitude > 0.5
+        horizontal = strong & ((angle < 22.5) | (angle >= 157.5))
+        vertical = strong & (67.5 <= angle) & (angle < 112.5)
+        self.edge_char_mask = np.select([horizontal, vertical], [1, 2], 0).astype(np.uint8)
         
         # Skip additional processing for better performance
         return resized  # Return the basic resized frame
     
-    def apply_pixel_to_ascii_strategy(self, pixel):
+    def convert_pixels_to_ascii_rows(self, frame):
         """
-        Optimized pixel to ASCII conversion with human figure highlighting
+        Override to select human, edge and background characters for the whole frame at once
         """
-        # Extract color information - no color manipulation to preserve original colors
-        bgr = tuple(float(x) for x in pixel[:3])
-        rgb = tuple(reversed(bgr))
-        
-        # Get pixel position
-        y, x = self.current_y, self.current_x
-        
-        # Check if this pixel is part of a human figure
-        is_human = False
-        if (self.human_mask is not None and 
-            x < self.human_mask.shape[1] and y < self.human_mask.shape[0]):
-            is_human = self.human_mask[y, x] > 0
-        
-        # Calculate brightness
-        bright = ipe.rgb_to_brightness(*rgb)
-        
-        # If this is part of a human figure, use special characters
-        if is_human:
-            # Choose character based on brightness
-            index = min(int(bright / 256 * len(HUMAN_CHARS)), len(HUMAN_CHARS) - 1)
-            char = HUMAN_CHARS[index]
-            return ipe.colorize(char*2, ipe.rgb_to_ansi(*rgb))  # Use original colors
-        
-        # For edges, use simple directional characters
-        if (hasattr(self, 'gradient_magnitude') and self.gradient_magnitude is not None and 
-            x < self.gradient_magnitude.shape[1] and y < self.gradient_magnitude.shape[0]):
-            magnitude = self.gradient_magnitude[y, x]
-            
-            # Only use for strong edges
-            if magnitude > 0.5:
-                if hasattr(self, 'gradient_direction') and x < self.gradient_direction.shape[1]:
-                    angle = self.gradient_direction[y, x]
-                    # Simple directional character selection
-                    if -22.5 <= angle < 22.5 or 157.5 <= angle <= 180 or -180 <= angle < -157.5:
-                        return ipe.colorize('-'*2, ipe.rgb_to_ansi(*rgb))
-                    elif 67.5 <= angle < 112.5 or -112.5 <= angle < -67.5:
-                        return ipe.colorize('|'*2, ipe.rgb_to_ansi(*rgb))
-        
+        rgb = frame[..., ::-1].astype(np.float32)
+        bright = ipe.rgb_to_brightness_batch(frame)
+
         # For background, use simple brightness-based characters
-        # Use pixel_to_ascii directly for most pixels (fastest option)
-        return ipe.pixel_to_ascii(pixel, density=1)
-        
-    def convert_frame_pixels_to_ascii(self, frame, dimensions=strategy.DEFAULT_TERMINAL_SIZE, new_line_chars=False):
+        chars = ipe.pixels_to_ascii_batch(frame, density=1)
+        plain_color = np.zeros(chars.shape, dtype=bool)
+
+        # For strong edges, use simple directional characters
+        edge_chars = self._mask_region(self.edge_char_mask, chars.shape, 0)
+        is_edge = edge_chars > 0
+        chars[is_edge] = np.asarray(EDGE_CHARS)[edge_chars[is_edge]]
+        plain_color |= is_edge
+
+        # If this is part of a human figure, use special characters
+        is_human = self._mask_region(self.human_mask, chars.shape, 0) > 0
+        index = np.minimum((bright * (len(HUMAN_CHARS) / 256)).astype(np.int32), len(HUMAN_CHARS) - 1)
+        chars[is_human] = np.asarray(list(HUMAN_CHARS))[index[is_human]]
+        plain_color |= is_human
+
+        # Human figures and edges keep the original colors, background is saturated
+        colors = np.where(plain_color[..., None], rgb, ipe.increase_saturation_batch(rgb))
+        return ipe.colorize_rows(chars, colors)
+
+    @staticmethod
+    def _mask_region(mask, shape, fill):
         """
-        Override to track current pixel position for contextual character selection
+        Crop a per-pixel map to the printing area, filling the missing positions
         """
-        cols, _ = dimensions
-        h, w, _ = frame.shape
-
-        printing_width = int(min(int(cols), (w*2))/2)
-        pad = max(int(cols) - printing_width*2, 0) 
-         
-        msg = ''
-        for j in range(h-1):
-            self.current_y = j  # Track current row
-            for i in range(printing_width):
-                self.current_x = i  # Track current column
-                pixel = frame[j][i]
-                msg += self.apply_pixel_to_ascii_strategy(pixel)
-            if new_line_chars:
-                msg += "\n"
-            else:
-                msg += " " * (pad)
-        msg += "\r\n"
-        return msg 
\ No newline at end of file
+        region = np.full(shape, fill, dtype=None if mask is None else mask.dtype)
+        if mask is not None:
+            h, w = min(shape[0], mask.shape[0]), min(shape[1], mask.shape[1])
+            region[:h, :w] = mask[:h, :w]
+        return region
@@ -1,8 +1,16 @@
 """Module with useful functions to image processing"""
 
 import colorsys
+import functools
+import os
+import numpy as np
 from xtermcolor import colorize
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 CHARS_LIGHT = [' ', ' ', '.', ':', '!', '+', '*', 'e', '$', '@', '8']
 CHARS_COLOR = ['.', '*', 'e', 's', '◍']
 CHARS_FILLED = ['░', '▒', '▓', '█']
@@ -10,6 +18,11 @@ CHARS_DETAILED = [' ', '.', '·', ':', ';', '\'', '`', '"', '^', ',', '-', '~',
 
 DENSITY = [CHARS_LIGHT, CHARS_COLOR, CHARS_FILLED, CHARS_DETAILED]
 
+RESET = "\x1b[0m"
+
+# Terminals with 24-bit color support announce it with COLORTERM
+TRUECOLOR = os.environ.get('COLORTERM') in ('truecolor', '24bit') and os.isatty(1)
+
 def brightness_to_ascii(i, density=0):
     """
     Get an appropriate char of brightness from a rgb color
@@ -19,13 +32,109 @@ def brightness_to_ascii(i, density=0):
     index = int(size * i / 255)
     return chars_collection[index]
 
+def pixels_to_ascii_batch(frame_bgr, density=0, grayscale=False):
+    """
+    Convert a whole frame to a 2D array of chars according to its brightness
+    """
+    chars_collection = DENSITY[density]
+    size = len(chars_collection) - 1
+    if frame_to_indices is not None:
+        index = np.empty(frame_bgr.shape[:2], dtype=np.int32)
+        frame_to_indices(frame_bgr, index, size, grayscale)
+    else:
+        bright = rgb_to_brightness_batch(frame_bgr, grayscale)
+        index = (bright * (size / 255)).astype(np.int32)
+    return np.asarray(chars_collection)[index]
+
+def frame_to_ascii(frame_bgr, colored=True, density=0):
+    """
+    Convert a whole frame the same way pixel_to_ascii converts each pixel
+    and return the resulting list of rows
+    """
+    if colored:
+        chars = pixels_to_ascii_batch(frame_bgr, density)
+        return colorize_rows(chars, increase_saturation_batch(frame_bgr[..., ::-1]))
+    chars = pixels_to_ascii_batch(frame_bgr, density, grayscale=True)
+    return ["".join([char*2 for char in row]) for row in chars.tolist()]
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def frame_to_indices(frame_bgr, out_idx, size, grayscale=False):
+        """
+        Write the brightness char index of each pixel of a bgr frame into out_idx
+        """
+        rows, cols = out_idx.shape
+        for y in prange(rows):
+            for x in range(cols):
+                b, g, r = frame_bgr[y, x, 0], frame_bgr[y, x, 1], frame_bgr[y, x, 2]
+                if grayscale:
+                    bright = 0.2126*r + 0.7152*g + 0.0722*b
+                else:
+                    bright = 0.267*r + 0.642*g + 0.091*b
+                out_idx[y, x] = min(max(int(bright * size / 255), 0), size)
+else:
+    frame_to_indices = None
+
+@functools.lru_cache(maxsize=None)
 def colorize_char(char, ansi_color):
     """
-    Get an appropriate char of brightness from a rgb color
+    Get a char wrapped in the escape sequence of an ansi color, cached
+    since there are only a few hundred colors for each char
     """
     str_colorized = colorize(char, ansi=ansi_color)
     return str_colorized
 
+@functools.lru_cache(maxsize=None)
+def ansi_prefix(ansi_color):
+    """
+    Get the escape sequence that starts an ansi color, or an empty string
+    if colorize doesn't color the output
+    """
+    str_colorized = colorize('', ansi=ansi_color)
+    return str_colorized[:-len(RESET)] if str_colorized.endswith(RESET) else ''
+
+def truecolor_prefix(r, g, b):
+    """
+    Get the escape sequence that starts a 24-bit rgb color
+    """
+    return f"\x1b[38;2;{int(r)};{int(g)};{int(b)}m"
+
+def truecolor(char, r, g, b):
+    """
+    Get a char wrapped in the escape sequence of a 24-bit rgb color
+    """
+    return truecolor_prefix(r, g, b) + char + RESET
+
+def colorize_rows(chars, frame_rgb):
+    """
+    Colorize a 2D array of chars with the colors of a rgb frame, every char
+    is printed twice, and return the resulting list of rows
+
+    The color escape sequence is only written when the color changes
+    along the row and reset once at the end of it
+    """
+    if TRUECOLOR:
+        colors = np.clip(frame_rgb, 0, 255).astype(np.uint8)
+        changes = np.any(colors[:, 1:] != colors[:, :-1], axis=-1)
+        prefixes = [[truecolor_prefix(*color) for color in row] for row in colors.tolist()]
+    else:
+        ansi = rgb_to_ansi_batch(frame_rgb[..., ::-1])
+        changes = ansi[:, 1:] != ansi[:, :-1]
+        prefixes = [[ansi_prefix(code) for code in row] for row in ansi.tolist()]
+
+    rows = []
+    for char_row, prefix_row, change_row in zip(chars.tolist(), prefixes, changes):
+        starts = [0] + (np.flatnonzero(change_row) + 1).tolist()
+        ends = starts[1:] + [len(char_row)]
+        parts = []
+        for start, end in zip(starts, ends):
+            parts.append(prefix_row[start])
+            parts.append("".join([char*2 for char in char_row[start:end]]))
+        if prefix_row and prefix_row[0]:
+            parts.append(RESET)
+        rows.append("".join(parts))
+    return rows
+
 def pixel_to_ascii(pixel, colored=True, density=0):
     """
     Convert a pixel to char
@@ -37,8 +146,11 @@ def pixel_to_ascii(pixel, colored=True, density=0):
         bright = rgb_to_brightness(*rgb)
         rgb = increase_saturation(*rgb)
         char = brightness_to_ascii(bright, density)
-        ansi_color = rgb_to_ansi(*rgb)
-        char = colorize(char*2, ansi=ansi_color)
+        if TRUECOLOR:
+            char = truecolor(char*2, *rgb)
+        else:
+            ansi_color = rgb_to_ansi(*rgb)
+            char = colorize_char(char*2, ansi_color)
     else:
         bright = rgb_to_brightness(*rgb, grayscale=True)
         char = brightness_to_ascii(bright, density)
@@ -56,6 +168,37 @@ def increase_saturation(r, g, b):
     r2, g2, b2 = colorsys.hsv_to_rgb(h, s, v)
     return r2*255, g2*255, b2*255
 
+def increase_saturation_batch(frame_rgb):
+    """
+    Increase the saturation of a whole rgb frame and return the new frame as float32
+    """
+    frame = np.asarray(frame_rgb, dtype=np.float32) / 255
+    r, g, b = frame[..., 0], frame[..., 1], frame[..., 2]
+    cmax = frame.max(axis=-1)
+    cmin = frame.min(axis=-1)
+    delta = cmax - cmin
+    safe_delta = np.where(delta > 0, delta, 1)
+
+    h = np.select([cmax == r, cmax == g],
+                  [(g - b) / safe_delta, 2.0 + (b - r) / safe_delta],
+                  4.0 + (r - g) / safe_delta)
+    h = np.where(delta > 0, (h / 6.0) % 1.0, 0)
+    s = np.where(delta > 0, delta / np.where(cmax > 0, cmax, 1), 0)
+    s = np.minimum(s+0.3, 1.0)
+    v = np.minimum(cmax+0.1, 1.0)  # Slightly increase brightness too
+
+    i = (h * 6.0).astype(np.int32)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    sectors = [i == 0, i == 1, i == 2, i == 3, i == 4]
+    r2 = np.select(sectors, [v, q, p, p, t], v)
+    g2 = np.select(sectors, [t, v, v, q, p], p)
+    b2 = np.select(sectors, [p, p, t, v, v], q)
+    return np.stack((r2, g2, b2), axis=-1) * 255
+
 def rgb_to_brightness(r, g, b, grayscale=False):
     """
     Calc a brightness factor according to rgb color
@@ -65,12 +208,23 @@ def rgb_to_brightness(r, g, b, grayscale=False):
     else:
         return 0.267*r + 0.642*g + 0.091*b
 
+# rgb_to_brightness factors in bgr order
+BRIGHTNESS_BGR = np.array([0.091, 0.642, 0.267], dtype=np.float32)
+BRIGHTNESS_BGR_GRAYSCALE = np.array([0.0722, 0.7152, 0.2126], dtype=np.float32)
+
+def rgb_to_brightness_batch(frame_bgr, grayscale=False):
+    """
+    Calc the brightness factor of each pixel of a bgr frame as float32
+    """
+    factors = BRIGHTNESS_BGR_GRAYSCALE if grayscale else BRIGHTNESS_BGR
+    return np.dot(frame_bgr.astype(np.float32), factors)
+
 def rgb_to_ansi(r, g, b):
     """
     Convert an rgb color to ansi color
     """
     (r, g, b) = int(r), int(g), int(b)
-    if r == g & g == b:
+    if r == g == b:
         if r < 8:
             return int(16)
         if r > 248:
@@ -83,3 +237,16 @@ def rgb_to_ansi(r, g, b):
     b_in_range = to_ansi_range(b)
     ansi = 16 + (36 * r_in_range) + (6 * g_in_range) + b_in_range
     return int(ansi)
+
+# Lookup tables to convert a whole frame with the same rules as rgb_to_ansi
+ANSI_LEVELS = np.array([int(round(a / 51.0)) for a in range(256)], dtype=np.uint8)
+ANSI_GRAYS = np.array([rgb_to_ansi(a, a, a) for a in range(256)], dtype=np.uint8)
+
+def rgb_to_ansi_batch(frame_bgr):
+    """
+    Convert a whole bgr frame to a 2D array of ansi colors
+    """
+    frame = np.clip(frame_bgr, 0, 255).astype(np.uint8)
+    b, g, r = frame[..., 0], frame[..., 1], frame[..., 2]
+    ansi = 16 + 36 * ANSI_LEVELS[r] + 6 * ANSI_LEVELS[g] + ANSI_LEVELS[b]
+    return np.where((r == g) & (g == b), ANSI_GRAYS[r], ansi)
@@ -3,6 +3,7 @@
 
 from colored import fg, attr
 import colorsys
+import numpy as np
 
 CHARS_LIGHT = [' ', ' ', '.', ':', '!', '+', '*', 'e', '$', '@', '8']
 CHARS_COLOR = ['.', '*', 'e', 's', '◍']
@@ -22,6 +23,14 @@ def rgb_to_colorhex(r, g, b):
         B = '0'+format(int(b), 'x')
     return f'#{R.upper()}{G.upper()}{B.upper()}'
 
+def rgb_to_colorhex_batch(frame_rgb):
+    """
+    Convert a whole rgb frame to a 2D array of colors packed as 0xRRGGBB,
+    formatted the same as rgb_to_colorhex with '#%06X'
+    """
+    frame = np.clip(frame_rgb, 0, 255).astype(np.uint32)
+    return (frame[..., 0] << 16) | (frame[..., 1] << 8) | frame[..., 2]
+
 def brightness_to_ascii(i, density=0):
     """
     Get an appropriate char of brightness from a rgb color
@@ -31,6 +40,27 @@ def brightness_to_ascii(i, density=0):
     index = int(size * i / 255)
     return chars_collection[index]
 
+def pixels_to_ascii_batch(frame_bgr, density=0, grayscale=False):
+    """
+    Convert a whole frame to a 2D array of chars according to its brightness
+    """
+    bright = rgb_to_brightness_batch(frame_bgr, grayscale)
+    chars_collection = DENSITY[density]
+    size = len(chars_collection) - 1
+    index = (bright * (size / 255)).astype(np.int32)
+    return np.asarray(chars_collection)[index]
+
+def frame_to_ascii(frame_bgr, colored=True, density=0):
+    """
+    Convert a whole frame the same way pixel_to_ascii converts each pixel
+    and return the resulting list of rows
+    """
+    if colored:
+        chars = pixels_to_ascii_batch(frame_bgr, density)
+        return colorize_rows(chars, increase_saturation_batch(frame_bgr[..., ::-1]))
+    chars = pixels_to_ascii_batch(frame_bgr, density, grayscale=True)
+    return ["".join([char*2 for char in row]) for row in chars.tolist()]
+
 def colorize_char(char, colorhex):
     """
     Get an appropriate char of brightness from a rgb color
@@ -38,6 +68,30 @@ def colorize_char(char, colorhex):
     str_colorized = fg(colorhex)+char+attr('reset')
     return str_colorized
 
+def colorize_rows(chars, frame_rgb):
+    """
+    Colorize a 2D array of chars with the colors of a rgb frame, every char
+    is printed twice, and return the resulting list of rows
+
+    The color is only written when it changes along the row and reset
+    once at the end of it
+    """
+    colors = rgb_to_colorhex_batch(frame_rgb)
+    changes = colors[:, 1:] != colors[:, :-1]
+
+    rows = []
+    for char_row, color_row, change_row in zip(chars.tolist(), colors.tolist(), changes):
+        starts = [0] + (np.flatnonzero(change_row) + 1).tolist()
+        ends = starts[1:] + [len(char_row)]
+        parts = []
+        for start, end in zip(starts, ends):
+            parts.append(fg('#%06X' % color_row[start]))
+            parts.append("".join([char*2 for char in char_row[start:end]]))
+        if char_row:
+            parts.append(attr('reset'))
+        rows.append("".join(parts))
+    return rows
+
 def pixel_to_ascii(pixel, colored=True, density=0):
     """
     Convert a pixel to char
@@ -65,6 +119,40 @@ def increase_saturation(r, g, b):
     s = min(s+0.3, 1.0)
     return colorsys.hsv_to_rgb(h, s, v)
 
+def increase_saturation_batch(frame_rgb):
+    """
+    Increase the saturation of a whole rgb frame and return the new frame,
+    in float64 since the hex colors keep every level
+    """
+    frame = np.asarray(frame_rgb, dtype=np.float64)
+    r, g, b = frame[..., 0], frame[..., 1], frame[..., 2]
+    cmax = frame.max(axis=-1)
+    cmin = frame.min(axis=-1)
+    delta = cmax - cmin
+    safe_delta = np.where(delta > 0, delta, 1)
+
+    # same operations as colorsys so the hex colors match pixel_to_ascii
+    rc = (cmax - r) / safe_delta
+    gc = (cmax - g) / safe_delta
+    bc = (cmax - b) / safe_delta
+    h = np.select([cmax == r, cmax == g], [bc - gc, 2.0 + rc - bc], 4.0 + gc - rc)
+    h = np.where(delta > 0, (h / 6.0) % 1.0, 0)
+    s = np.where(delta > 0, delta / np.where(cmax > 0, cmax, 1), 0)
+    s = np.minimum(s+0.3, 1.0)
+    v = cmax
+
+    i = (h * 6.0).astype(np.int32)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    sectors = [i == 0, i == 1, i == 2, i == 3, i == 4]
+    r2 = np.select(sectors, [v, q, p, p, t], v)
+    g2 = np.select(sectors, [t, v, v, q, p], p)
+    b2 = np.select(sectors, [p, p, t, v, v], q)
+    return np.stack((r2, g2, b2), axis=-1)
+
 def rgb_to_brightness(r, g, b, grayscale=False):
     """
     Calc a brightness factor according to rgb color
@@ -73,3 +161,14 @@ def rgb_to_brightness(r, g, b, grayscale=False):
         return 0.2126*r + 0.7152*g + 0.0722*b
     else:
         return 0.267*r + 0.642*g + 0.091*b
+
+# rgb_to_brightness factors in bgr order
+BRIGHTNESS_BGR = np.array([0.091, 0.642, 0.267], dtype=np.float32)
+BRIGHTNESS_BGR_GRAYSCALE = np.array([0.0722, 0.7152, 0.2126], dtype=np.float32)
+
+def rgb_to_brightness_batch(frame_bgr, grayscale=False):
+    """
+    Calc the brightness factor of each pixel of a bgr frame as float32
+    """
+    factors = BRIGHTNESS_BGR_GRAYSCALE if grayscale else BRIGHTNESS_BGR
+    return np.dot(frame_bgr.astype(np.float32), factors)
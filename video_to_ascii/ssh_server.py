@@ -2,7 +2,9 @@
 SSH Server module to stream ASCII video to SSH clients
 """
 
+import functools
 import os
+import queue
 import socket
 import sys
 import threading
@@ -10,7 +12,17 @@ import paramiko
 import argparse
 import time
 import cv2
-from . import video_engine as ve
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import ffmpegcv
+except (ImportError, RuntimeError):  # ffmpegcv raises RuntimeError without ffmpeg
+    ffmpegcv = None
 
 # Generate a key pair for the SSH server
 if not os.path.exists('ssh_host_key'):
@@ -66,42 +78,428 @@ class SSHServerInterface(paramiko.ServerInterface):
         return True
 
 
+def hsv_to_ansi(hue, sat):
+    """Map an OpenCV hsv color to one of the 8 basic ANSI color codes"""
+    color_code = 37  # Default white
+    
+    # Very simple color mapping
+    if sat > 50:  # Only color saturated pixels
+        if hue < 30 or hue > 150:  # Red
+            color_code = 31
+        elif hue < 90:  # Green
+            color_code = 32
+        elif hue < 150:  # Blue
+            color_code = 34
+        elif hue < 180:  # Cyan
+            color_code = 36
+        elif hue < 270:  # Magenta
+            color_code = 35
+        else:  # Yellow
+            color_code = 33
+    return color_code
+
+
+# Length of the escape sequences of a colored char: "\033[b;ccm" and "\033[0m"
+COLOR_PREFIX_SIZE = 7
+COLOR_SUFFIX_SIZE = 4
+
+if njit is not None:
+    @functools.lru_cache(maxsize=None)
+    def make_renderer(cols, colored):
+        """
+        Compile a kernel writing the ASCII rows of frames cols pixels wide into
+        an output buffer, with the width and the color mode as compile time
+        constants since they don't change during a session
+        
+        The kernels release the GIL so the clients render in parallel, rows
+        are too few for parallel=True to pay off its thread dispatching
+        """
+        @njit(cache=True, nogil=True, boundscheck=False)
+        def render_rows(codes, code_chars, prefixes, suffix, out_buf):
+            """
+            Write the ASCII rows of a frame of cell codes into out_buf, every char
+            twice, and return the number of bytes written
+
+            The escape sequence of a color is only written when the color changes
+            along the row and reset once at the end of it
+            """
+            rows = codes.shape[0]
+            n = 0
+            for y in range(rows):
+                if y > 0:
+                    out_buf[n] = 13  # \r
+                    out_buf[n + 1] = 10  # \n
+                    n += 2
+                last_color = -1
+                for x in range(cols):
+                    code = codes[y, x]
+                    if colored and code & 15 != last_color:
+                        last_color = code & 15
+                        prefix = prefixes[last_color]
+                        for i in range(COLOR_PREFIX_SIZE):
+                            out_buf[n + i] = prefix[i]
+                        n += COLOR_PREFIX_SIZE
+                    char = code_chars[code]
+                    out_buf[n] = char
+                    out_buf[n + 1] = char
+                    n += 2
+                if colored:
+                    for i in range(COLOR_SUFFIX_SIZE):
+                        out_buf[n + i] = suffix[i]
+                    n += COLOR_SUFFIX_SIZE
+            return n
+        return render_rows
+else:
+    make_renderer = None
+
+
+# Number of frames decoded ahead of the playback, enough to absorb the
+# decoding spikes of keyframes without holding many full frames in memory
+DECODE_AHEAD = 4
+
+
+class FrameReader(threading.Thread):
+    """Thread decoding the frames of a video ahead of the playback"""
+    
+    def __init__(self, cap, size=DECODE_AHEAD):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.frames = queue.Queue(maxsize=size)
+        self.finished = False
+        self._stopped = threading.Event()
+    
+    def run(self):
+        try:
+            while not self._stopped.is_set():
+                ret, frame = self.cap.read()
+                if not ret or frame is None:
+                    break
+                self.frames.put(frame)
+        finally:
+            # Mark the end of the video
+            self.frames.put(None)
+    
+    def read(self):
+        """Get the next decoded frame like VideoCapture.read"""
+        frame = self.frames.get()
+        self.finished = frame is None
+        return not self.finished, frame
+    
+    def stop(self):
+        """Stop decoding and wait for the thread to end"""
+        self._stopped.set()
+        # Unblock the thread if it's waiting for room in the queue
+        while not self.finished:
+            self.read()
+        self.join()
+
+
+def open_capture(video_path, colored, size=None):
+    """
+    Open a video, decoded by ffmpeg when ffmpegcv is available, preferring the
+    NVDEC GPU decoder, and scaled to size if given. Return the capture, its fps,
+    its frame size and its frame count
+    """
+    if ffmpegcv is not None:
+        pix_fmt = 'bgr24' if colored else 'gray'
+        for open_video in (ffmpegcv.VideoCaptureNV, ffmpegcv.VideoCapture):
+            try:
+                cap = open_video(video_path, pix_fmt=pix_fmt, resize=size, resize_keepratio=False)
+                return cap, cap.fps or 30, (cap.origin_width, cap.origin_height), cap.count or 0
+            except Exception as e:
+                print(f"Could not open video with {open_video.__name__}: {str(e)}")
+    
+    cap = cv2.VideoCapture(video_path)
+    frame_size = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    return cap, cap.get(cv2.CAP_PROP_FPS) or 30, frame_size, int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+
+class FrameBroadcaster(threading.Thread):
+    """
+    Thread decoding a video once at its frame rate for all the clients streaming
+    it, which share the frames resized and rendered for their terminal size
+    """
+    
+    def __init__(self, video_path, colored, size=None, loop=True):
+        super().__init__(daemon=True)
+        self.video_path = video_path
+        self.colored = colored
+        self.size = size
+        self.loop = loop
+        self.cap, self.fps, self.frame_size, self.frame_count = open_capture(video_path, colored, size)
+        
+        # Latest decoded frame, its index counts every frame since the start
+        self.frame = None
+        self.index = -1
+        self.finished = False
+        self.clients = 0
+        self._condition = threading.Condition()
+        self._stopped = False
+        
+        # Latest frame resized and rendered for every terminal size
+        self._renders = {}
+        self._render_lock = threading.Lock()
+        self._resized = None
+    
+    def run(self):
+        reader = FrameReader(self.cap)
+        reader.start()
+        try:
+            time_delta = 1./self.fps
+            start_time = None
+            decoded = 0
+            while True:
+                with self._condition:
+                    # Don't decode while nobody is watching
+                    if not self.clients:
+                        start_time = None
+                    self._condition.wait_for(lambda: self.clients or self._stopped)
+                    if self._stopped:
+                        break
+                
+                ret, frame = reader.read()
+                if not ret:
+                    if not self.loop or not decoded:
+                        break
+                    # Start the video over
+                    reader.stop()
+                    self.cap.release()
+                    self.cap = open_capture(self.video_path, self.colored, self.size)[0]
+                    reader = FrameReader(self.cap)
+                    reader.start()
+                    decoded = 0
+                    continue
+                decoded += 1
+                
+                with self._condition:
+                    self.frame = frame
+                    self.index += 1
+                    self._condition.notify_all()
+                
+                # Maintain framerate against a fixed schedule so the delays don't accumulate
+                if start_time is None:
+                    start_time, scheduled = time.monotonic(), 0
+                scheduled += 1
+                time.sleep(max(0, start_time + scheduled * time_delta - time.monotonic()))
+        finally:
+            reader.stop()
+            self.cap.release()
+            with self._condition:
+                self.finished = True
+                self._condition.notify_all()
+    
+    def stop(self):
+        """Stop decoding and wait for the thread to end"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self.is_alive():
+            self.join()
+    
+    def add_client(self):
+        """Register a client, the video is only decoded while there are any"""
+        with self._condition:
+            self.clients += 1
+            self._condition.notify_all()
+    
+    def remove_client(self):
+        """Unregister a client"""
+        with self._condition:
+            self.clients -= 1
+    
+    def wait_frame(self, index):
+        """
+        Wait for a frame newer than the one at index and return the latest
+        frame with its index, or None at the end of the video
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.index > index or self.finished)
+            if self.index > index:
+                return self.index, self.frame
+            return index, None
+    
+    def render(self, index, frame, size, quantize, render):
+        """
+        Get a frame resized to size and quantized to cell codes with the quantize
+        function, and its output rendered with the render function, shared by
+        all the clients with the same terminal size
+        """
+        with self._render_lock:
+            cached = self._renders.get(size)
+            if cached is None or cached[0] != index:
+                codes = quantize(self.resize(frame, size), self.colored)
+                cached = index, codes, bytes(render(codes, self.colored))
+                self._renders[size] = cached
+            return cached[1:]
+    
+    def resize(self, frame, size):
+        """Resize a frame to size and convert it to HSV or grayscale"""
+        if frame.shape[2] == 1:
+            # The frame is decoded in grayscale
+            frame = frame[..., 0]
+        
+        # Resize with correct aspect ratio before converting, so the conversion
+        # only runs on the small frame, unless the frame is already decoded at size
+        if frame.shape[1::-1] != size:
+            frame = self._resized = cv2.resize(frame, size, dst=self._resized)
+        
+        if self.colored:
+            # Convert frame to HSV for better color mapping
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        if frame.ndim == 3:
+            # Use grayscale for non-color strategies
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+
+def is_colored(strategy):
+    """Check if a strategy is streamed with colors, based on its name"""
+    return bool(strategy and any(s in strategy for s in ['color', 'adaptive', 'cinematic']))
+
+
 class SSHStreamStrategy:
     """Strategy for streaming ASCII video to SSH clients"""
     
-    def __init__(self, channel, server, video_path, strategy=None):
+    def __init__(self, channel, server, video_path, strategy=None, broadcaster=None):
         self.channel = channel
         self.server = server  # Store server to access terminal dimensions
         self.video_path = video_path
         self.strategy = strategy
-        self.engine = None
-        
-    def setup_engine(self):
-        """Set up the video engine with the appropriate strategy"""
-        self.engine = ve.VideoEngine()
-        self.engine.load_video_from_file(self.video_path)
-        if self.strategy:
-            self.engine.set_strategy(self.strategy)
-            print(f"Using strategy: {self.strategy}")
-    
+        self.broadcaster = broadcaster  # Shared decoder, the stream has its own if None
+        
+        # Very simple character set that works in all terminals
+        self.ascii_chars = ' .:;+=xX$&@'
+        ascii_bytes = np.frombuffer(self.ascii_chars.encode(), dtype=np.uint8)
+        
+        # Every pixel is quantized to a cell code, its char index in the high
+        # 4 bits and for colored frames its bright flag and color code - 30
+        # in the low 4 bits, which is all the rendering needs from it
+        size = len(self.ascii_chars) - 1
+        self.index_lut = np.array([min(i * size // 255, size) for i in range(256)], dtype=np.uint8)
+        self.gray_codes = self.index_lut << 4
+        
+        # Brightness - use bold for brighter pixels
+        self.value_codes = self.gray_codes | np.array([(i > 128) << 3 for i in range(256)], dtype=np.uint8)
+        
+        # Color code - 30 of every hue, for unsaturated and saturated pixels
+        self.color_lut = np.array([[hsv_to_ansi(hue, sat) - 30 for sat in (0, 255)] for hue in range(256)],
+                                  dtype=np.uint8)
+        
+        # Char of every cell code, and the char twice for better aspect
+        # ratio as 2-byte words
+        self.code_chars = ascii_bytes[np.minimum(np.arange(256) >> 4, size)]
+        self.pair_lut = np.frombuffer(self.code_chars.repeat(2).tobytes(), dtype=np.uint16)
+        
+        # Escape sequences of every color of the cell codes, also as a table
+        self.prefixes = [f"\033[{bright};{color_code}m".encode() for bright in (0, 1) for color_code in range(30, 38)]
+        self.suffix = b"\033[0m"
+        self.prefix_bytes = np.array([list(prefix) for prefix in self.prefixes], dtype=np.uint8)
+        self.suffix_bytes = np.frombuffer(self.suffix, dtype=np.uint8)
+        self._out_buf = np.empty(0, dtype=np.uint8)
+        self._previous_frame = None
+        
     def safe_send(self, data):
-        """Send data safely in smaller chunks to prevent socket errors"""
+        """Send data safely, reporting socket errors instead of raising them"""
         try:
             # Convert to bytes if it's a string
             if isinstance(data, str):
                 data = data.encode('utf-8')
             
-            # Send in smaller chunks (4KB)
-            chunk_size = 4096
-            for i in range(0, len(data), chunk_size):
-                chunk = data[i:i+chunk_size]
-                self.channel.send(chunk)
-                time.sleep(0.001)  # Small delay between chunks
+            # Send the whole data at once, the channel splits it into packets
+            self.channel.sendall(data)
             return True
         except Exception as e:
             print(f"Send error: {str(e)}")
             return False
         
+    def output_buffer(self, size):
+        """
+        Get the buffer the frames are rendered into, growing it to fit size bytes,
+        a rendered frame is only valid until the next one is rendered
+        """
+        if len(self._out_buf) < size:
+            self._out_buf = np.empty(size, dtype=np.uint8)
+        return self._out_buf
+    
+    def quantize_frame(self, frame, colored):
+        """Quantize a resized hsv or grayscale frame to the cell codes of its pixels"""
+        if not colored:
+            return cv2.LUT(frame, self.gray_codes)
+        
+        # Simple ANSI color mapping - 8 colors
+        codes = cv2.LUT(frame[..., 2], self.value_codes)
+        codes |= self.color_lut[frame[..., 0], (frame[..., 1] > 50).astype(np.uint8)]
+        return codes
+    
+    def render_color(self, codes):
+        """Render a frame of cell codes to ASCII with 8 basic ANSI colors"""
+        if make_renderer is not None:
+            rows, cols = codes.shape
+            out_buf = self.output_buffer(rows * (cols * (COLOR_PREFIX_SIZE + 2) + COLOR_SUFFIX_SIZE + 2))
+            n = make_renderer(cols, True)(codes, self.code_chars, self.prefix_bytes, self.suffix_bytes, out_buf)
+            return memoryview(out_buf)[:n]
+        
+        # Write the escape sequence of a color only when it changes along
+        # a row and reset it once at the end of the row
+        colors = codes & 15
+        changes = colors[:, 1:] != colors[:, :-1]
+        
+        # Map cell codes to ASCII chars for the whole frame at once
+        pairs = cv2.LUT(codes, self.pair_lut)
+        lines = []
+        for pair_row, color_row, change_row in zip(pairs, colors.tolist(), changes):
+            starts = [0] + (np.flatnonzero(change_row) + 1).tolist()
+            ends = starts[1:] + [len(pair_row)]
+            parts = []
+            for start, end in zip(starts, ends):
+                parts.append(self.prefixes[color_row[start]])
+                parts.append(pair_row[start:end].tobytes())
+            parts.append(self.suffix)
+            lines.append(b"".join(parts))
+        
+        # Join with proper newlines
+        return b"\r\n".join(lines)
+    
+    def render_gray(self, codes):
+        """Render a frame of cell codes to ASCII without colors"""
+        if make_renderer is not None:
+            rows, cols = codes.shape
+            out_buf = self.output_buffer(rows * (cols * 2 + 2))
+            n = make_renderer(cols, False)(codes, self.code_chars, self.prefix_bytes, self.suffix_bytes, out_buf)
+            return memoryview(out_buf)[:n]
+        
+        # Map cell codes to ASCII chars, using each character twice
+        # for better aspect ratio
+        row_bytes = cv2.LUT(codes, self.pair_lut)
+        
+        # Format output with proper line endings for SSH
+        return b"\r\n".join([row.tobytes() for row in row_bytes])
+    
+    def render_frame(self, codes, colored):
+        """Render a frame of cell codes to ASCII"""
+        if colored:
+            return self.render_color(codes)
+        return self.render_gray(codes)
+    
+    def render_rows(self, codes, rows, colored):
+        """Render some rows of a frame of cell codes, each one preceded by its cursor position"""
+        lines = bytes(self.render_frame(codes[rows], colored)).split(b"\r\n")
+        return b"".join([b"\033[%d;1H" % (y + 1) + line for y, line in zip(rows.tolist(), lines)])
+    
+    def changed_rows(self, codes):
+        """
+        Get the indices of the rows of a frame of cell codes that changed since
+        the previous frame, or None if the whole frame has to be rendered
+        """
+        previous = self._previous_frame
+        if previous is None or previous.shape != codes.shape:
+            self._previous_frame = codes.copy()
+            return None
+        
+        changed = np.flatnonzero((codes != previous).any(axis=1))
+        np.copyto(previous, codes)
+        return None if len(changed) == len(codes) else changed
+    
     def stream_to_client(self):
         """Stream video to SSH client"""
         try:
@@ -109,145 +507,74 @@ class SSHStreamStrategy:
             self.safe_send("Preparing video for streaming...\r\n")
             time.sleep(0.5)
             
-            # Use minimalist rendering to avoid connection issues
-            cap = cv2.VideoCapture(self.video_path)
-            if not cap.isOpened():
-                self.safe_send("Error: Could not open video file.\r\n")
-                return
+            # Get safe terminal dimensions, they don't change during the session
+            cols = max(30, min(self.server.terminal_width - 5, 80))
+            rows = max(15, min(self.server.terminal_height - 5, 35))
+            aspect_ratio = 0.4  # Terminal character aspect ratio
+            new_width = int(cols * aspect_ratio)
             
-            # Get video properties
-            fps = cap.get(cv2.CAP_PROP_FPS) or 30
-            time_delta = 1./fps
+            colored = is_colored(self.strategy)
             
-            # Very simple character set that works in all terminals
-            ascii_chars = ' .:;+=xX$&@'
+            # Compile the renderer of this terminal size before the playback starts
+            self.render_frame(np.zeros((rows, new_width), dtype=np.uint8), colored)
+            
+            # Use minimalist rendering to avoid connection issues, decoding the
+            # video for this client only when there isn't a shared broadcaster
+            broadcaster = self.broadcaster
+            if broadcaster is None:
+                broadcaster = FrameBroadcaster(self.video_path, colored, (new_width, rows), loop=False)
+            if not broadcaster.cap.isOpened():
+                self.safe_send("Error: Could not open video file.\r\n")
+                return
+            width, height = broadcaster.frame_size
             
             # Clear screen
             self.safe_send("\033[2J\033[H")
             self.safe_send("Starting playback...\r\n\n")
             time.sleep(0.5)
             
-            # Main playback loop
-            frame_count = 0
-            while cap.isOpened():
-                t0 = time.time()
-                ret, frame = cap.read()
-                if not ret or frame is None:
-                    break
-                
-                # Get safe terminal dimensions
-                cols = max(30, min(self.server.terminal_width - 5, 80))
-                rows = max(15, min(self.server.terminal_height - 5, 35))
-                
-                # For color version, use the strategy name to determine approach
-                if self.strategy and any(s in self.strategy for s in ['color', 'adaptive', 'cinematic']):
-                    # Try minimal color rendering - just 8 basic ANSI colors
-                    # Convert frame to HSV for better color mapping
-                    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-                    h, s, v = cv2.split(hsv)
-                    
-                    # Resize with correct aspect ratio
-                    height, width = frame.shape[:2]
-                    aspect_ratio = 0.4  # Terminal character aspect ratio
-                    new_width = int(cols * aspect_ratio)
-                    
-                    # Resize all channels
-                    h_resized = cv2.resize(h, (new_width, rows))
-                    s_resized = cv2.resize(s, (new_width, rows))
-                    v_resized = cv2.resize(v, (new_width, rows))
-                    
-                    # Generate ASCII output with color
-                    lines = []
-                    for y in range(rows):
-                        line = ""
-                        for x in range(new_width):
-                            # Get pixel values
-                            hue = h_resized[y, x]
-                            sat = s_resized[y, x]
-                            val = v_resized[y, x]
-                            
-                            # Map brightness to ASCII char
-                            char_index = min(int(val / 255 * (len(ascii_chars) - 1)), len(ascii_chars) - 1)
-                            char = ascii_chars[char_index]
-                            
-                            # Simple ANSI color mapping - 8 colors
-                            color_code = 37  # Default white
-                            
-                            # Very simple color mapping
-                            if sat > 50:  # Only color saturated pixels
-                                if hue < 30 or hue > 150:  # Red
-                                    color_code = 31
-                                elif hue < 90:  # Green
-                                    color_code = 32
-                                elif hue < 150:  # Blue
-                                    color_code = 34
-                                elif hue < 180:  # Cyan
-                                    color_code = 36
-                                elif hue < 270:  # Magenta
-                                    color_code = 35
-                                else:  # Yellow
-                                    color_code = 33
-                                    
-                            # Brightness - use bold for brighter pixels
-                            bright = 1 if val > 128 else 0
-                            
-                            # Format with ANSI color
-                            colored_char = f"\033[{bright};{color_code}m{char*2}\033[0m"
-                            line += colored_char
-                        
-                        lines.append(line)
-                    
-                    # Join with proper newlines
-                    output = "\r\n".join(lines)
-                else:
-                    # Use grayscale for non-color strategies
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # Debug info
+            debug_info = f"Frame size: {width}x{height}, Terminal: {cols}x{rows}, Strategy: {self.strategy}\r\n"
+            self.safe_send(debug_info)
+            time.sleep(1)
+            
+            # Main playback loop, until the whole video was played once when it loops
+            broadcaster.add_client()
+            if broadcaster is not self.broadcaster:
+                broadcaster.start()
+            try:
+                index = first_index = broadcaster.index
+                while True:
+                    index, frame = broadcaster.wait_frame(index)
+                    if frame is None or broadcaster.loop and 0 < broadcaster.frame_count < index - first_index:
+                        break
                     
-                    # Resize with correct aspect ratio
-                    height, width = gray.shape
-                    aspect_ratio = 0.4  # Terminal character aspect ratio
-                    new_width = int(cols * aspect_ratio)
-                    gray_resized = cv2.resize(gray, (new_width, rows))
+                    # Generate ASCII output, only for the rows that changed since
+                    # the previous frame, if any
+                    codes, output = broadcaster.render(index, frame, (new_width, rows), self.quantize_frame,
+                                                       self.render_frame)
+                    changed = self.changed_rows(codes)
+                    if changed is not None:
+                        output = self.render_rows(codes, changed, colored) if len(changed) else None
                     
-                    # Generate ASCII output
-                    lines = []
-                    for y in range(rows):
-                        line = ""
-                        for x in range(new_width):
-                            # Get pixel intensity and map to ASCII char
-                            intensity = gray_resized[y, x]
-                            char_index = min(int(intensity / 255 * (len(ascii_chars) - 1)), len(ascii_chars) - 1)
-                            # Use character twice for better aspect ratio
-                            line += ascii_chars[char_index] * 2
-                        lines.append(line)
+                    # Position cursor at top, the changed rows carry their own position
+                    if changed is None:
+                        self.safe_send("\033[H")
                     
-                    # Format output with proper line endings for SSH
-                    output = "\r\n".join(lines)
-                
-                # Debug info (first frame only)
-                if frame_count == 0:
-                    debug_info = f"Frame size: {width}x{height}, Terminal: {cols}x{rows}, Strategy: {self.strategy}\r\n"
-                    self.safe_send(debug_info)
-                    time.sleep(1)
-                
-                # Position cursor at top
-                self.safe_send("\033[H")
-                
-                # Send frame
-                success = self.safe_send(output)
-                if not success:
-                    print("Failed to send frame, connection may be closed")
-                    break
-                
-                # Maintain framerate
-                frame_count += 1
-                elapsed = time.time() - t0
-                sleep_time = max(0, time_delta - elapsed)
-                time.sleep(sleep_time)
+                    # Send frame
+                    if output is not None:
+                        success = self.safe_send(output)
+                        if not success:
+                            print("Failed to send frame, connection may be closed")
+                            break
+            finally:
+                broadcaster.remove_client()
+                if broadcaster is not self.broadcaster:
+                    broadcaster.stop()
             
-            # Clean up
-            cap.release()
-            self.safe_send("\r\n\r\nPlayback complete\r\n")
+            # Clean up, moving the cursor below the frame in case the last
+            # update left it on a row in the middle
+            self.safe_send(f"\033[{rows};1H\r\n\r\nPlayback complete\r\n")
             
         except Exception as e:
             error_msg = f"Error streaming video: {str(e)}\r\n"
@@ -265,9 +592,13 @@ class SSHStreamStrategy:
                 pass
 
 
-def handle_client(client, addr, video_path, strategy=None):
+def handle_client(client, addr, video_path, strategy=None, broadcaster=None):
     """Handle an individual SSH client connection"""
     try:
+        # Send every frame as soon as it is written instead of waiting
+        # to coalesce it with the next one (Nagle's algorithm)
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
         transport = paramiko.Transport(client)
         transport.set_keepalive(10)  # Enable keepalive to prevent timeout
         transport.add_server_key(key)
@@ -294,8 +625,7 @@ def handle_client(client, addr, video_path, strategy=None):
         channel.send("Press Ctrl+C to exit\r\n\n")
         
         # Create stream and play video
-        streamer = SSHStreamStrategy(channel, server, video_path, strategy)
-        streamer.setup_engine()
+        streamer = SSHStreamStrategy(channel, server, video_path, strategy, broadcaster)
         streamer.stream_to_client()
         
     except Exception as e:
@@ -314,6 +644,13 @@ def run_server(video_path, host='0.0.0.0', port=2222, strategy=None):
         print(f"Error: Video file '{video_path}' not found")
         return
     
+    # Decode the video once for all the clients
+    broadcaster = FrameBroadcaster(video_path, is_colored(strategy))
+    if not broadcaster.cap.isOpened():
+        print(f"Error: Could not open video file '{video_path}'")
+        return
+    broadcaster.start()
+    
     # Create socket
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -331,7 +668,7 @@ def run_server(video_path, host='0.0.0.0', port=2222, strategy=None):
             print(f"Connection from {addr[0]}:{addr[1]}")
             
             # Handle each client in a separate thread
-            t = threading.Thread(target=handle_client, args=(client, addr, video_path, strategy))
+            t = threading.Thread(target=handle_client, args=(client, addr, video_path, strategy, broadcaster))
             t.daemon = True
             t.start()
             
@@ -340,6 +677,7 @@ def run_server(video_path, host='0.0.0.0', port=2222, strategy=None):
     except Exception as e:
         print(f"Error: {str(e)}")
     finally:
+        broadcaster.stop()
         try:
             sock.close()
         except:
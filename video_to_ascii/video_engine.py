@@ -9,7 +9,7 @@ class VideoEngine:
     """
 
     def __init__(self, strategy="default"):
-        strategy_object = re.STRATEGIES[strategy]
+        strategy_object = re.STRATEGIES[strategy]()
         self.render_strategy = strategy_object
         self.read_buffer = None
         self.with_audio = False
@@ -18,7 +18,7 @@ class VideoEngine:
         """
         Set a render strategy
         """
-        strategy_object = re.STRATEGIES[strategy]
+        strategy_object = re.STRATEGIES[strategy]()
         self.render_strategy = strategy_object
 
     def load_video_from_file(self, filename):